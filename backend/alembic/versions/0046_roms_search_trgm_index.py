@@ -0,0 +1,48 @@
+"""Add trigram indexes for rom search
+
+Revision ID: 0046_roms_search_trgm_index
+Revises: 0045_roms_metadata_update
+Create Date: 2025-06-20 00:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from utils.database import is_postgresql
+
+# revision identifiers, used by Alembic.
+revision = "0046_roms_search_trgm_index"
+down_revision = "0045_roms_metadata_update"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    connection = op.get_bind()
+    # Trigram GIN indexes let PostgreSQL serve the `ILIKE '%term%'` search
+    # filters from the index, instead of scanning the whole roms table
+    if is_postgresql(connection):
+        connection.execute(sa.text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        op.create_index(
+            "idx_roms_fs_name_trgm",
+            "roms",
+            ["fs_name"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={"fs_name": "gin_trgm_ops"},
+        )
+        op.create_index(
+            "idx_roms_name_trgm",
+            "roms",
+            ["name"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    connection = op.get_bind()
+    if is_postgresql(connection):
+        op.drop_index("idx_roms_name_trgm", table_name="roms")
+        op.drop_index("idx_roms_fs_name_trgm", table_name="roms")
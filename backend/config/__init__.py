@@ -20,6 +20,8 @@ DEV_MODE: Final = str_to_bool(os.environ.get("DEV_MODE", "false"))
 DEV_HOST: Final = os.environ.get("DEV_HOST", "127.0.0.1")
 DEV_PORT: Final = int(os.environ.get("DEV_PORT", "5000"))
 DEV_SQL_ECHO: Final = str_to_bool(os.environ.get("DEV_SQL_ECHO", "false"))
+# Worker threads per process for sync endpoints and other blocking calls
+THREADPOOL_MAX_WORKERS: Final = int(os.environ.get("THREADPOOL_MAX_WORKERS", 40))
 
 # PATHS
 ROMM_BASE_PATH: Final = os.environ.get("ROMM_BASE_PATH", "/romm")
@@ -35,6 +37,11 @@ DB_USER: Final = os.environ.get("DB_USER")
 DB_PASSWD: Final = os.environ.get("DB_PASSWD")
 DB_NAME: Final = os.environ.get("DB_NAME", "romm")
 ROMM_DB_DRIVER: Final = os.environ.get("ROMM_DB_DRIVER", "mariadb")
+DB_POOL_SIZE: Final = int(os.environ.get("DB_POOL_SIZE", 20))
+DB_MAX_OVERFLOW: Final = int(os.environ.get("DB_MAX_OVERFLOW", 10))
+DB_POOL_RECYCLE_SECONDS: Final = int(
+    os.environ.get("DB_POOL_RECYCLE_SECONDS", 30 * 60)
+)  # 30 minutes
 
 # REDIS
 REDIS_HOST: Final = os.environ.get("REDIS_HOST", "127.0.0.1")
@@ -59,6 +66,10 @@ IGDB_CLIENT_ID: Final = os.environ.get(
 IGDB_CLIENT_SECRET: Final = os.environ.get(
     "IGDB_CLIENT_SECRET", os.environ.get("CLIENT_SECRET", "")
 ).strip()
+# Seconds to cache IGDB API responses in Redis, disabled by default
+IGDB_RESPONSE_CACHE_SECONDS: Final = int(
+    os.environ.get("IGDB_RESPONSE_CACHE_SECONDS", 0)
+)
 
 # MOBYGAMES
 MOBYGAMES_API_KEY: Final = os.environ.get("MOBYGAMES_API_KEY", "").strip()
@@ -150,6 +161,11 @@ SCHEDULED_UPDATE_LAUNCHBOX_METADATA_CRON: Final = os.environ.get(
     "0 5 * * *",  # At 5:00 AM every day
 )
 
+# UPLOADS
+UPLOAD_CHUNK_SIZE_BYTES: Final = int(
+    os.environ.get("UPLOAD_CHUNK_SIZE_BYTES", 1024 * 1024)
+)  # 1 MiB
+
 # EMULATION
 DISABLE_EMULATOR_JS = str_to_bool(os.environ.get("DISABLE_EMULATOR_JS", "false"))
 DISABLE_RUFFLE_RS = str_to_bool(os.environ.get("DISABLE_RUFFLE_RS", "false"))
@@ -0,0 +1,15 @@
+from models.rom import RomUserStatus
+from pydantic import BaseModel
+
+
+class RomUserForm(BaseModel):
+    note_raw_markdown: str | None = None
+    note_is_public: bool | None = None
+    is_main_sibling: bool | None = None
+    backlogged: bool | None = None
+    now_playing: bool | None = None
+    hidden: bool | None = None
+    rating: int | None = None
+    difficulty: int | None = None
+    completion: int | None = None
+    status: RomUserStatus | None = None
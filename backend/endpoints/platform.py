@@ -1,3 +1,4 @@
+import threading
 from datetime import datetime, timezone
 from typing import Annotated
 
@@ -9,6 +10,7 @@ from exceptions.fs_exceptions import PlatformAlreadyExistsException
 from fastapi import Body
 from fastapi import Path as PathVar
 from fastapi import Request, status
+from fastapi.responses import Response
 from handler.auth.constants import Scope
 from handler.database import db_platform_handler
 from handler.filesystem import fs_platform_handler
@@ -17,6 +19,8 @@ from handler.scan_handler import scan_platform
 from logger.formatter import BLUE
 from logger.formatter import highlight as hl
 from logger.logger import log
+from models.platform import Platform
+from pydantic.type_adapter import TypeAdapter
 from utils.router import APIRouter
 
 router = APIRouter(
@@ -25,16 +29,67 @@ router = APIRouter(
 )
 
 
+_PLATFORM_LIST_ADAPTER = TypeAdapter(list[PlatformSchema])
+
+# Encoded platform payloads, keyed by the values that can change them. Stale
+# keys are never hit again, and are evicted oldest-first once the cache is full.
+# The user-editable fields are part of the key, as updated_at only has second
+# precision on some databases. The lock is needed as sync endpoints encode from
+# the threadpool, while async ones do it on the event loop
+PLATFORM_JSON_CACHE_SIZE = 512
+_platform_json_cache: dict[tuple, str] = {}
+_platform_json_cache_lock = threading.Lock()
+
+
+def _platform_cache_key(platform: Platform) -> tuple:
+    return (
+        platform.id,
+        platform.updated_at,
+        platform.aspect_ratio,
+        platform.custom_name,
+        platform.rom_count,
+        platform.fs_size_bytes,
+        tuple((f.id, f.updated_at) for f in platform.firmware),
+    )
+
+
+def _encode_platform(platform: Platform) -> str:
+    key = _platform_cache_key(platform)
+    with _platform_json_cache_lock:
+        content = _platform_json_cache.get(key)
+    if content is None:
+        content = PlatformSchema.from_orm_fast(platform).model_dump_json()
+        with _platform_json_cache_lock:
+            if len(_platform_json_cache) >= PLATFORM_JSON_CACHE_SIZE:
+                _platform_json_cache.pop(next(iter(_platform_json_cache)), None)
+            _platform_json_cache[key] = content
+
+    return content
+
+
+def _platform_response(
+    platform: Platform, status_code: int = status.HTTP_200_OK
+) -> Response:
+    # Encode with pydantic-core directly, so FastAPI doesn't dump, re-validate
+    # and re-encode the already validated schema
+    return Response(
+        content=_encode_platform(platform),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
 @protected_route(
     router.post,
     "",
     [Scope.PLATFORMS_WRITE],
     status_code=status.HTTP_201_CREATED,
+    response_model=PlatformSchema,
 )
 async def add_platform(
     request: Request,
     fs_slug: Annotated[str, Body(description="Platform slug.", embed=True)],
-) -> PlatformSchema:
+) -> Response:
     """Create a platform."""
 
     try:
@@ -43,22 +98,37 @@ async def add_platform(
         log.info(f"Detected platform: {hl(fs_slug)}")
 
     scanned_platform = await scan_platform(fs_slug, [fs_slug])
-    return PlatformSchema.model_validate(
-        db_platform_handler.add_platform(scanned_platform)
+    return _platform_response(
+        db_platform_handler.add_platform(scanned_platform),
+        status_code=status.HTTP_201_CREATED,
     )
 
 
-@protected_route(router.get, "", [Scope.PLATFORMS_READ])
-def get_platforms(request: Request) -> list[PlatformSchema]:
+@protected_route(
+    router.get,
+    "",
+    [Scope.PLATFORMS_READ],
+    response_model=list[PlatformSchema],
+)
+def get_platforms(request: Request) -> Response:
     """Retrieve platforms."""
 
-    return [
-        PlatformSchema.model_validate(p) for p in db_platform_handler.get_platforms()
-    ]
+    # Join the already encoded platforms, instead of letting FastAPI validate
+    # and encode the whole list again
+    platforms = db_platform_handler.get_platforms()
+    return Response(
+        content=f"[{','.join(_encode_platform(p) for p in platforms)}]",
+        media_type="application/json",
+    )
 
 
-@protected_route(router.get, "/supported", [Scope.PLATFORMS_READ])
-def get_supported_platforms(request: Request) -> list[PlatformSchema]:
+@protected_route(
+    router.get,
+    "/supported",
+    [Scope.PLATFORMS_READ],
+    response_model=list[PlatformSchema],
+)
+def get_supported_platforms(request: Request) -> Response:
     """Retrieve the list of supported platforms."""
 
     db_platforms = db_platform_handler.get_platforms()
@@ -71,6 +141,7 @@ def get_supported_platforms(request: Request) -> list[PlatformSchema]:
         sup_plat = {
             "id": platform_id,
             "name": platform["name"],
+            "display_name": platform["name"],
             "fs_slug": platform["slug"],
             "slug": platform["slug"],
             "logo_path": "",
@@ -83,9 +154,13 @@ def get_supported_platforms(request: Request) -> list[PlatformSchema]:
             "is_identified": True,
             "missing_from_fs": False,
         }
-        supported_platforms.append(PlatformSchema.model_validate(sup_plat).model_dump())
+        supported_platforms.append(PlatformSchema.model_validate(sup_plat))
 
-    return supported_platforms
+    # Serialize the whole list in a single pydantic-core call
+    return Response(
+        content=_PLATFORM_LIST_ADAPTER.dump_json(supported_platforms),
+        media_type="application/json",
+    )
 
 
 @protected_route(
@@ -93,17 +168,18 @@ def get_supported_platforms(request: Request) -> list[PlatformSchema]:
     "/{id}",
     [Scope.PLATFORMS_READ],
     responses={status.HTTP_404_NOT_FOUND: {}},
+    response_model=PlatformSchema,
 )
 def get_platform(
     request: Request,
     id: Annotated[int, PathVar(description="Platform id.", ge=1)],
-) -> PlatformSchema:
+) -> Response:
     """Retrieve a platform by ID."""
 
     platform = db_platform_handler.get_platform(id)
     if not platform:
         raise PlatformNotFoundInDatabaseException(id)
-    return PlatformSchema.model_validate(platform)
+    return _platform_response(platform)
 
 
 @protected_route(
@@ -111,6 +187,7 @@ def get_platform(
     "/{id}",
     [Scope.PLATFORMS_WRITE],
     responses={status.HTTP_404_NOT_FOUND: {}},
+    response_model=PlatformSchema,
 )
 async def update_platform(
     request: Request,
@@ -119,7 +196,7 @@ async def update_platform(
     custom_name: Annotated[
         str | None, Body(description="Custom platform name.")
     ] = None,
-) -> PlatformSchema:
+) -> Response:
     """Update a platform."""
 
     platform_db = db_platform_handler.get_platform(id)
@@ -132,7 +209,7 @@ async def update_platform(
         platform_db.custom_name = custom_name
     platform_db = db_platform_handler.add_platform(platform_db)
 
-    return PlatformSchema.model_validate(platform_db)
+    return _platform_response(platform_db)
 
 
 @protected_route(
@@ -1,7 +1,7 @@
 from datetime import datetime, timezone
 
-from pydantic import BaseModel as PydanticBaseModel
-from pydantic import ConfigDict
+from pydantic.config import ConfigDict
+from pydantic.main import BaseModel as PydanticBaseModel
 
 
 class BaseModel(PydanticBaseModel):
@@ -1,6 +1,10 @@
+from __future__ import annotations
+
 from datetime import datetime
 from typing import TypedDict
 
+from models.firmware import Firmware
+
 from .base import BaseModel
 
 
@@ -28,6 +32,16 @@ class FirmwareSchema(BaseModel):
     class Config:
         from_attributes = True
 
+    @classmethod
+    def from_orm_fast(cls, db_firmware: Firmware) -> FirmwareSchema:
+        """Build the schema from a database row, skipping field validation."""
+        return cls.model_construct(
+            **{name: getattr(db_firmware, name) for name in _FIRMWARE_FIELD_NAMES}
+        )
+
+
+_FIRMWARE_FIELD_NAMES = tuple(FirmwareSchema.model_fields)
+
 
 class AddFirmwareResponse(TypedDict):
     uploaded: int
@@ -1,8 +1,11 @@
+from __future__ import annotations
+
+import sys
 from datetime import datetime
 
 from handler.metadata.moby_handler import MOBYGAMES_PLATFORM_LIST
-from models.platform import DEFAULT_COVER_ASPECT_RATIO
-from pydantic import Field, computed_field, field_validator
+from models.platform import DEFAULT_COVER_ASPECT_RATIO, Platform
+from pydantic.fields import computed_field
 
 from .base import BaseModel
 from .firmware import FirmwareSchema
@@ -15,6 +18,7 @@ class PlatformSchema(BaseModel):
     rom_count: int
     name: str
     custom_name: str | None = None
+    display_name: str
     igdb_id: int | None = None
     sgdb_id: int | None = None
     moby_id: int | None = None
@@ -30,7 +34,7 @@ class PlatformSchema(BaseModel):
     url: str | None = None
     url_logo: str | None = None
     logo_path: str | None = None
-    firmware: list[FirmwareSchema] = Field(default_factory=list)
+    firmware: tuple[FirmwareSchema, ...] = ()
     aspect_ratio: str = DEFAULT_COVER_ASPECT_RATIO
     created_at: datetime
     updated_at: datetime
@@ -41,15 +45,26 @@ class PlatformSchema(BaseModel):
 
     class Config:
         from_attributes = True
+        frozen = True
 
-    @computed_field  # type: ignore
-    @property
-    def display_name(self) -> str:
-        return self.custom_name or self.name
+    @classmethod
+    def from_orm_fast(cls, db_platform: Platform) -> PlatformSchema:
+        """Build the schema from a database row, skipping field validation.
 
-    @field_validator("firmware")
-    def sort_files(cls, v: list[FirmwareSchema]) -> list[FirmwareSchema]:
-        return sorted(v, key=lambda x: x.file_name)
+        Values coming from the database are already typed, so validating them
+        again is wasted work on the hot platform listing paths.
+        """
+        data = {name: getattr(db_platform, name) for name in _PLATFORM_FIELD_NAMES}
+        data["display_name"] = db_platform.custom_name or db_platform.name
+        # These come from a small set of values, so share a single copy of each
+        for name in _INTERNED_FIELD_NAMES:
+            if value := data[name]:
+                data[name] = sys.intern(value)
+        # Firmware is already ordered by file name by the relationship
+        data["firmware"] = tuple(
+            FirmwareSchema.from_orm_fast(f) for f in db_platform.firmware
+        )
+        return cls.model_construct(**data)
 
     @computed_field  # type: ignore
     @property
@@ -61,3 +76,11 @@ class PlatformSchema(BaseModel):
             return None
 
         return MOBYGAMES_PLATFORM_LIST[self.slug].get("slug", None)
+
+
+_PLATFORM_FIELD_NAMES = tuple(
+    name
+    for name in PlatformSchema.model_fields
+    if name not in ("display_name", "firmware")
+)
+_INTERNED_FIELD_NAMES = ("category", "family_slug", "aspect_ratio")
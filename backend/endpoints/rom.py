@@ -1,20 +1,25 @@
-import binascii
+import asyncio
+import hashlib
 from base64 import b64encode
-from datetime import datetime, timezone
+from collections.abc import AsyncIterator
+from datetime import datetime
 from io import BytesIO
 from stat import S_IFREG
 from typing import Annotated, Any
 from urllib.parse import quote
 from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile, ZipInfo
+from zlib import crc32
 
 from anyio import Path, open_file
 from config import (
     DEV_MODE,
     DISABLE_DOWNLOAD_ENDPOINT_AUTH,
     LIBRARY_BASE_PATH,
+    UPLOAD_CHUNK_SIZE_BYTES,
     str_to_bool,
 )
 from decorators.auth import protected_route
+from endpoints.forms.rom import RomUserForm
 from endpoints.responses import MessageResponse
 from endpoints.responses.rom import (
     DetailedRomSchema,
@@ -37,7 +42,7 @@ from fastapi import (
     UploadFile,
     status,
 )
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 from fastapi_pagination.ext.sqlalchemy import paginate
 from fastapi_pagination.limit_offset import LimitOffsetPage, LimitOffsetParams
 from handler.auth.constants import Scope
@@ -54,8 +59,10 @@ from handler.metadata import (
 from logger.formatter import BLUE
 from logger.formatter import highlight as hl
 from logger.logger import log
-from models.rom import RomFile
+from models.rom import Rom, RomFile
 from pydantic import BaseModel
+from sqlalchemy import func
+from starlette.concurrency import run_in_threadpool
 from starlette.requests import ClientDisconnect
 from starlette.responses import FileResponse
 from streaming_form_data import StreamingFormDataParser
@@ -70,6 +77,162 @@ router = APIRouter(
     tags=["roms"],
 )
 
+ZIP_STREAM_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+
+
+class _ZipStreamWriter:
+    """Write-only file object buffering what ZipFile writes, until it's drained."""
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+
+    def write(self, data: bytes) -> int:
+        self._buffer.extend(data)
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+
+async def _stream_to_parser(request: Request, parser: StreamingFormDataParser) -> None:
+    # Coalesce the small chunks handed over by the server, so the parser
+    # is called once per slab instead of once per chunk
+    buffer = bytearray()
+    async for chunk in request.stream():
+        buffer += chunk
+        if len(buffer) >= UPLOAD_CHUNK_SIZE_BYTES:
+            parser.data_received(bytes(buffer))
+            buffer.clear()
+
+    if buffer:
+        parser.data_received(bytes(buffer))
+
+
+async def _file_response(path: str, filename: str) -> FileResponse:
+    # Hand the stat result over to Starlette, which then takes the length and
+    # caching headers from the file on disk and doesn't stat it a second time
+    quoted_filename = quote(filename)
+    return FileResponse(
+        path=path,
+        stat_result=await Path(path).stat(),
+        media_type="application/octet-stream",
+        headers={
+            "Content-Disposition": f"attachment; filename*=UTF-8''{quoted_filename}; filename=\"{quoted_filename}\"",
+        },
+    )
+
+
+async def _serve_single_file(file: RomFile) -> Response:
+    # Serve the file directly in development mode for emulatorjs
+    if DEV_MODE:
+        return await _file_response(
+            f"{LIBRARY_BASE_PATH}/{file.full_path}", file.file_name
+        )
+
+    # Otherwise proxy through nginx
+    return FileRedirectResponse(
+        download_path=Path(f"/library/{file.full_path}"),
+    )
+
+
+def _build_streamed_zip_response(
+    files: list[RomFile], rom: Rom, file_name: str, hidden_folder: bool
+) -> StreamingResponse:
+    download_names = [f.file_name_for_download(rom, hidden_folder) for f in files]
+
+    async def stream_zip() -> AsyncIterator[bytes]:
+        writer = _ZipStreamWriter()
+        date_time = datetime.now().timetuple()[:6]
+
+        with ZipFile(writer, "w") as zip_file:
+            # Add content files
+            for file, download_name in zip(files, download_names, strict=True):
+                file_path = f"{LIBRARY_BASE_PATH}/{file.full_path}"
+                zip_info = ZipInfo(filename=download_name, date_time=date_time)
+                zip_info.external_attr = S_IFREG | 0o600
+                zip_info.compress_type = (
+                    ZIP_DEFLATED if file.file_size_bytes > 0 else ZIP_STORED
+                )
+
+                try:
+                    # Copy in chunks, sending compressed bytes as they come
+                    async with await open_file(file_path, "rb") as f:
+                        with zip_file.open(zip_info, "w", force_zip64=True) as zf:
+                            while chunk := await f.read(ZIP_STREAM_CHUNK_SIZE):
+                                zf.write(chunk)
+                                if data := writer.drain():
+                                    yield data
+                except FileNotFoundError:
+                    log.error(f"File {hl(file_path)} not found!")
+                    raise
+
+                if data := writer.drain():
+                    yield data
+
+            # Add M3U file if not already present
+            if not rom.has_m3u_file():
+                m3u_encoded_content = "\n".join(download_names).encode()
+                m3u_filename = f"{rom.fs_name}.m3u"
+                m3u_info = ZipInfo(filename=m3u_filename, date_time=date_time)
+                m3u_info.external_attr = S_IFREG | 0o600
+                m3u_info.compress_type = ZIP_STORED
+                zip_file.writestr(m3u_info, m3u_encoded_content)
+
+        # Closing the archive writes the central directory
+        yield writer.drain()
+
+    return StreamingResponse(
+        stream_zip(),
+        media_type="application/zip",
+        headers={
+            "Content-Disposition": f"attachment; filename*=UTF-8''{quote(file_name)}.zip; filename=\"{quote(file_name)}.zip\"",
+        },
+    )
+
+
+def _build_m3u_line(download_names: list[str], file_name: str) -> ZipContentLine:
+    """Build the mod_zip line for a generated m3u playlist, served inline by nginx."""
+    m3u_encoded_content = "\n".join(download_names).encode()
+    m3u_base64_content = b64encode(m3u_encoded_content).decode()
+    return ZipContentLine(
+        crc32=crc32_to_hex(crc32(m3u_encoded_content)),
+        size_bytes=len(m3u_encoded_content),
+        encoded_location=f"/decode?value={m3u_base64_content}",
+        filename=f"{file_name}.m3u",
+    )
+
+
+def _build_zip_response(
+    files: list[RomFile], rom: Rom, file_name: str, hidden_folder: bool
+) -> ZipResponse:
+    """Let nginx build the zip with mod_zip, from the list of files to include."""
+
+    download_names = [f.file_name_for_download(rom, hidden_folder) for f in files]
+
+    # Sizes come from the database like the checksums, instead of a stat per file
+    content_lines = [
+        ZipContentLine(
+            crc32=f.crc_hash,
+            size_bytes=f.file_size_bytes,
+            encoded_location=quote(f"/library-zip/{f.full_path}"),
+            filename=download_name,
+        )
+        for f, download_name in zip(files, download_names, strict=True)
+    ]
+
+    if not rom.has_m3u_file():
+        content_lines.append(_build_m3u_line(download_names, file_name))
+
+    return ZipResponse(
+        content_lines=content_lines,
+        filename=f"{quote(file_name)}.zip",
+    )
+
 
 @protected_route(
     router.post,
@@ -113,7 +276,7 @@ async def add_rom(
         f"Uploading file to {hl(db_platform.custom_name or db_platform.name, color=BLUE)}[{hl(platform_fs_slug)}]"
     )
 
-    file_location = fs_rom_handler.validate_path(f"{roms_path}/{filename}")
+    file_location = Path(fs_rom_handler.validate_path(f"{roms_path}/{filename}"))
 
     parser = StreamingFormDataParser(headers=request.headers)
     parser.register("x-upload-platform", NullTarget())
@@ -130,19 +293,17 @@ async def add_rom(
     # Create the directory if it doesn't exist
     await fs_rom_handler.make_directory(roms_path)
 
-    def cleanup_partial_file():
-        if file_location.exists():
-            file_location.unlink()
+    async def cleanup_partial_file():
+        await file_location.unlink(missing_ok=True)
 
     try:
-        async for chunk in request.stream():
-            parser.data_received(chunk)
+        await _stream_to_parser(request, parser)
     except ClientDisconnect:
         log.error("Client disconnected during upload")
-        cleanup_partial_file()
+        await cleanup_partial_file()
     except Exception as exc:
         log.error("Error uploading files", exc_info=exc)
-        cleanup_partial_file()
+        await cleanup_partial_file()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="There was an error uploading the file(s)",
@@ -312,12 +473,13 @@ def get_roms(
     router.get,
     "/{id}",
     [] if DISABLE_DOWNLOAD_ENDPOINT_AUTH else [Scope.ROMS_READ],
-    responses={status.HTTP_404_NOT_FOUND: {}},
+    responses={status.HTTP_404_NOT_FOUND: {}, status.HTTP_304_NOT_MODIFIED: {}},
+    response_model=DetailedRomSchema,
 )
 def get_rom(
     request: Request,
     id: Annotated[int, PathVar(description="Rom internal id.", ge=1)],
-) -> DetailedRomSchema:
+) -> Response:
     """Retrieve a rom by ID."""
 
     rom = db_rom_handler.get_rom(id)
@@ -325,7 +487,17 @@ def get_rom(
     if not rom:
         raise RomNotFoundInDatabaseException(id)
 
-    return DetailedRomSchema.from_orm_with_request(rom, request)
+    # The response includes the user's saves, states, notes and collections,
+    # which don't touch the rom itself, so tag the encoded payload instead
+    content = DetailedRomSchema.from_orm_with_request(rom, request).model_dump_json()
+    etag = f'W/"{hashlib.blake2b(content.encode(), digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "private, max-age=0, must-revalidate"}
+
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=content, media_type="application/json", headers=headers)
 
 
 @protected_route(
@@ -358,33 +530,8 @@ async def head_rom_content(
         files = [f for f in rom.files if f.id in file_id_values]
     files.sort(key=lambda x: x.file_name)
 
-    # Serve the file directly in development mode for emulatorjs
-    if DEV_MODE:
-        if len(files) == 1:
-            file = files[0]
-            rom_path = f"{LIBRARY_BASE_PATH}/{file.full_path}"
-            return FileResponse(
-                path=rom_path,
-                filename=file.file_name,
-                headers={
-                    "Content-Disposition": f"attachment; filename*=UTF-8''{quote(file.file_name)}; filename=\"{quote(file.file_name)}\"",
-                    "Content-Type": "application/octet-stream",
-                    "Content-Length": str(file.file_size_bytes),
-                },
-            )
-
-        return Response(
-            headers={
-                "Content-Type": "application/zip",
-                "Content-Disposition": f"attachment; filename*=UTF-8''{quote(file_name)}.zip; filename=\"{quote(file_name)}.zip\"",
-            },
-        )
-
-    # Otherwise proxy through nginx
     if len(files) == 1:
-        return FileRedirectResponse(
-            download_path=Path(f"/library/{files[0].full_path}"),
-        )
+        return await _serve_single_file(files[0])
 
     return Response(
         media_type="application/zip",
@@ -439,114 +586,14 @@ async def get_rom_content(
         f"User {hl(current_username, color=BLUE)} is downloading {hl(rom.fs_name)}"
     )
 
-    # Serve the file directly in development mode for emulatorjs
-    if DEV_MODE:
-        if len(files) == 1:
-            file = files[0]
-            rom_path = f"{LIBRARY_BASE_PATH}/{file.full_path}"
-            return FileResponse(
-                path=rom_path,
-                filename=file.file_name,
-                headers={
-                    "Content-Disposition": f"attachment; filename*=UTF-8''{quote(file.file_name)}; filename=\"{quote(file.file_name)}\"",
-                    "Content-Type": "application/octet-stream",
-                    "Content-Length": str(file.file_size_bytes),
-                },
-            )
-
-        async def build_zip_in_memory() -> bytes:
-            # Initialize in-memory buffer
-            zip_buffer = BytesIO()
-            now = datetime.now()
-
-            with ZipFile(zip_buffer, "w") as zip_file:
-                # Add content files
-                for file in files:
-                    file_path = f"{LIBRARY_BASE_PATH}/{file.full_path}"
-                    try:
-                        # Read entire file into memory
-                        async with await open_file(file_path, "rb") as f:
-                            content = await f.read()
-
-                        # Create ZIP info with compression
-                        zip_info = ZipInfo(
-                            filename=file.file_name_for_download(rom, hidden_folder),
-                            date_time=now.timetuple()[:6],
-                        )
-                        zip_info.external_attr = S_IFREG | 0o600
-                        zip_info.compress_type = (
-                            ZIP_DEFLATED if file.file_size_bytes > 0 else ZIP_STORED
-                        )
-
-                        # Write file to ZIP
-                        zip_file.writestr(zip_info, content)
-
-                    except FileNotFoundError:
-                        log.error(f"File {hl(file_path)} not found!")
-                        raise
-
-                # Add M3U file if not already present
-                if not rom.has_m3u_file():
-                    m3u_encoded_content = "\n".join(
-                        [f.file_name_for_download(rom, hidden_folder) for f in files]
-                    ).encode()
-                    m3u_filename = f"{rom.fs_name}.m3u"
-                    m3u_info = ZipInfo(
-                        filename=m3u_filename, date_time=now.timetuple()[:6]
-                    )
-                    m3u_info.external_attr = S_IFREG | 0o600
-                    m3u_info.compress_type = ZIP_STORED
-                    zip_file.writestr(m3u_info, m3u_encoded_content)
-
-            # Get the completed ZIP file bytes
-            zip_buffer.seek(0)
-            return zip_buffer.getvalue()
-
-        zip_data = await build_zip_in_memory()
-
-        # Streams the zip file to the client
-        return Response(
-            content=zip_data,
-            media_type="application/zip",
-            headers={
-                "Content-Disposition": f"attachment; filename*=UTF-8''{quote(file_name)}.zip; filename=\"{quote(file_name)}.zip\"",
-            },
-        )
-
-    # Otherwise proxy through nginx
     if len(files) == 1:
-        return FileRedirectResponse(
-            download_path=Path(f"/library/{files[0].full_path}"),
-        )
+        return await _serve_single_file(files[0])
 
-    async def create_zip_content(f: RomFile, base_path: str = LIBRARY_BASE_PATH):
-        file_size = await fs_rom_handler.get_file_size(f.full_path)
-        return ZipContentLine(
-            crc32=f.crc_hash,
-            size_bytes=file_size,
-            encoded_location=quote(f"{base_path}/{f.full_path}"),
-            filename=f.file_name_for_download(rom, hidden_folder),
-        )
+    # Build the zip in process in development mode, as there's no nginx in front
+    if DEV_MODE:
+        return _build_streamed_zip_response(files, rom, file_name, hidden_folder)
 
-    content_lines = [await create_zip_content(f, "/library-zip") for f in files]
-
-    if not rom.has_m3u_file():
-        m3u_encoded_content = "\n".join(
-            [f.file_name_for_download(rom, hidden_folder) for f in files]
-        ).encode()
-        m3u_base64_content = b64encode(m3u_encoded_content).decode()
-        m3u_line = ZipContentLine(
-            crc32=crc32_to_hex(binascii.crc32(m3u_encoded_content)),
-            size_bytes=len(m3u_encoded_content),
-            encoded_location=f"/decode?value={m3u_base64_content}",
-            filename=f"{file_name}.m3u",
-        )
-        content_lines.append(m3u_line)
-
-    return ZipResponse(
-        content_lines=content_lines,
-        filename=f"{quote(file_name)}.zip",
-    )
+    return _build_zip_response(files, rom, file_name, hidden_folder)
 
 
 @protected_route(
@@ -620,52 +667,43 @@ async def update_rom(
         "launchbox_id": data.get("launchbox_id", rom.launchbox_id),
     }
 
+    # Fetch the changed metadata sources concurrently, then apply them in
+    # a fixed order, so later sources keep taking precedence
+    metadata_lookups = []
     if (
         cleaned_data.get("moby_id", "")
         and int(cleaned_data.get("moby_id", "")) != rom.moby_id
     ):
-        moby_rom = await meta_moby_handler.get_rom_by_id(
-            int(cleaned_data.get("moby_id", ""))
-        )
-        cleaned_data.update(moby_rom)
-        path_screenshots = await fs_resource_handler.get_rom_screenshots(
-            rom=rom,
-            url_screenshots=cleaned_data.get("url_screenshots", []),
+        metadata_lookups.append(
+            meta_moby_handler.get_rom_by_id(int(cleaned_data.get("moby_id", "")))
         )
-        cleaned_data.update({"path_screenshots": path_screenshots})
 
     if (
         cleaned_data.get("ss_id", "")
         and int(cleaned_data.get("ss_id", "")) != rom.ss_id
     ):
-        ss_rom = await meta_ss_handler.get_rom_by_id(cleaned_data["ss_id"])
-        cleaned_data.update(ss_rom)
-        path_screenshots = await fs_resource_handler.get_rom_screenshots(
-            rom=rom,
-            url_screenshots=cleaned_data.get("url_screenshots", []),
-        )
-        cleaned_data.update({"path_screenshots": path_screenshots})
+        metadata_lookups.append(meta_ss_handler.get_rom_by_id(cleaned_data["ss_id"]))
 
     if (
         cleaned_data.get("igdb_id", "")
         and int(cleaned_data.get("igdb_id", "")) != rom.igdb_id
     ):
-        igdb_rom = await meta_igdb_handler.get_rom_by_id(cleaned_data["igdb_id"])
-        cleaned_data.update(igdb_rom)
-        path_screenshots = await fs_resource_handler.get_rom_screenshots(
-            rom=rom,
-            url_screenshots=cleaned_data.get("url_screenshots", []),
+        metadata_lookups.append(
+            meta_igdb_handler.get_rom_by_id(cleaned_data["igdb_id"])
         )
-        cleaned_data.update({"path_screenshots": path_screenshots})
 
     if (
         cleaned_data.get("launchbox_id", "")
         and int(cleaned_data.get("launchbox_id", "")) != rom.launchbox_id
     ):
-        igdb_rom = await meta_launchbox_handler.get_rom_by_id(
-            cleaned_data["launchbox_id"]
+        metadata_lookups.append(
+            meta_launchbox_handler.get_rom_by_id(cleaned_data["launchbox_id"])
         )
-        cleaned_data.update(igdb_rom)
+
+    if metadata_lookups:
+        for metadata_rom in await asyncio.gather(*metadata_lookups):
+            cleaned_data.update(metadata_rom)
+
         path_screenshots = await fs_resource_handler.get_rom_screenshots(
             rom=rom,
             url_screenshots=cleaned_data.get("url_screenshots", []),
@@ -767,14 +805,7 @@ async def update_rom(
 
     # Update the rom files with the new fs_name
     if should_update_fs:
-        for file in rom.files:
-            db_rom_handler.update_rom_file(
-                file.id,
-                {
-                    "file_name": file.file_name.replace(rom.fs_name, new_fs_name),
-                    "file_path": file.file_path.replace(rom.fs_name, new_fs_name),
-                },
-            )
+        db_rom_handler.rename_rom_files(id, rom.fs_name, new_fs_name)
 
     # Refetch the rom from the database
     rom = db_rom_handler.get_rom(id)
@@ -809,7 +840,7 @@ async def add_rom_manuals(
         raise RomNotFoundInDatabaseException(id)
 
     manuals_path = f"{rom.fs_resources_path}/manual"
-    file_location = fs_rom_handler.validate_path(f"{manuals_path}/{rom.id}.pdf")
+    file_location = Path(fs_rom_handler.validate_path(f"{manuals_path}/{rom.id}.pdf"))
     log.info(f"Uploading manual to {hl(str(file_location))}")
 
     await fs_rom_handler.make_directory(manuals_path)
@@ -818,19 +849,17 @@ async def add_rom_manuals(
     parser.register("x-upload-platform", NullTarget())
     parser.register(filename, FileTarget(str(file_location)))
 
-    def cleanup_partial_file():
-        if file_location.exists():
-            file_location.unlink()
+    async def cleanup_partial_file():
+        await file_location.unlink(missing_ok=True)
 
     try:
-        async for chunk in request.stream():
-            parser.data_received(chunk)
+        await _stream_to_parser(request, parser)
     except ClientDisconnect:
         log.error("Client disconnected during upload")
-        cleanup_partial_file()
+        await cleanup_partial_file()
     except Exception as exc:
         log.error("Error uploading files", exc_info=exc)
-        cleanup_partial_file()
+        await cleanup_partial_file()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="There was an error uploading the manual",
@@ -872,17 +901,18 @@ async def delete_roms(
 ) -> MessageResponse:
     """Delete roms."""
 
+    db_roms = db_rom_handler.get_roms_by_ids(roms)
+    found_ids = {rom.id for rom in db_roms}
     for id in roms:
-        rom = db_rom_handler.get_rom(id)
-
-        if not rom:
+        if id not in found_ids:
             raise RomNotFoundInDatabaseException(id)
 
-        log.info(
-            f"Deleting {hl(str(rom.name or 'ROM'), color=BLUE)} [{hl(rom.fs_name)}] from database"
-        )
-        db_rom_handler.delete_rom(id)
+    log.info(
+        f"Deleting {', '.join(hl(str(rom.name or 'ROM'), color=BLUE) for rom in db_roms)} from database"
+    )
+    db_rom_handler.delete_roms(list(found_ids))
 
+    async def remove_resources(rom: Rom) -> None:
         try:
             await fs_resource_handler.remove_directory(rom.fs_resources_path)
         except FileNotFoundError:
@@ -890,17 +920,22 @@ async def delete_roms(
                 f"Couldn't find resources to delete for {hl(str(rom.name or 'ROM'), color=BLUE)}"
             )
 
-        if id in delete_from_fs:
-            log.info(f"Deleting {hl(rom.fs_name)} from filesystem")
-            try:
-                file_path = f"{rom.fs_path}/{rom.fs_name}"
-                await fs_rom_handler.remove_file(file_path=file_path)
-            except FileNotFoundError as exc:
-                error = f"Rom file {hl(rom.fs_name)} not found for platform {hl(rom.platform_display_name, color=BLUE)}[{hl(rom.platform_slug)}]"
-                log.error(error)
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND, detail=error
-                ) from exc
+    async def remove_rom_file(rom: Rom) -> None:
+        log.info(f"Deleting {hl(rom.fs_name)} from filesystem")
+        try:
+            file_path = f"{rom.fs_path}/{rom.fs_name}"
+            await fs_rom_handler.remove_file(file_path=file_path)
+        except FileNotFoundError as exc:
+            error = f"Rom file {hl(rom.fs_name)} not found for platform {hl(rom.platform_display_name, color=BLUE)}[{hl(rom.platform_slug)}]"
+            log.error(error)
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail=error
+            ) from exc
+
+    await asyncio.gather(*(remove_resources(rom) for rom in db_roms))
+    await asyncio.gather(
+        *(remove_rom_file(rom) for rom in db_roms if rom.id in delete_from_fs)
+    )
 
     return {"msg": f"{len(roms)} roms deleted successfully!"}
 
@@ -910,10 +945,18 @@ async def delete_roms(
     "/{id}/props",
     [Scope.ROMS_USER_WRITE],
     responses={status.HTTP_404_NOT_FOUND: {}},
+    response_model=RomUserSchema,
 )
-async def update_rom_user(
+def update_rom_user(
     request: Request,
     id: Annotated[int, PathVar(description="Rom internal id.", ge=1)],
+    data: Annotated[
+        RomUserForm,
+        Body(
+            description="Rom user data to update.",
+            default_factory=RomUserForm,
+        ),
+    ],
     update_last_played: Annotated[
         bool,
         Body(description="Whether to update the last played date."),
@@ -922,13 +965,11 @@ async def update_rom_user(
         bool,
         Body(description="Whether to remove the last played date."),
     ] = False,
-) -> RomUserSchema:
+) -> Response:
     """Update rom data associated to the current user."""
 
-    # TODO: Migrate to native FastAPI body parsing.
-    data = await request.json()
-    rom_user_data = data.get("data", {})
-
+    # Nothing here is awaited, so this runs as a sync endpoint, letting FastAPI
+    # move the blocking database calls off the event loop and into a worker thread
     rom = db_rom_handler.get_rom(id)
 
     if not rom:
@@ -938,33 +979,23 @@ async def update_rom_user(
         id, request.user.id
     ) or db_rom_handler.add_rom_user(id, request.user.id)
 
-    fields_to_update = [
-        "note_raw_markdown",
-        "note_is_public",
-        "is_main_sibling",
-        "backlogged",
-        "now_playing",
-        "hidden",
-        "rating",
-        "difficulty",
-        "completion",
-        "status",
-    ]
-
-    cleaned_data = {
-        field: rom_user_data[field]
-        for field in fields_to_update
-        if field in rom_user_data
-    }
+    # Only update the fields that were sent, which may be explicitly null
+    cleaned_data = data.model_dump(exclude_unset=True)
 
     if update_last_played:
-        cleaned_data.update({"last_played": datetime.now(timezone.utc)})
+        # Use the database clock, so every worker stamps the same time source
+        cleaned_data.update({"last_played": func.now()})
     elif remove_last_played:
         cleaned_data.update({"last_played": None})
 
     rom_user = db_rom_handler.update_rom_user(db_rom_user.id, cleaned_data)
 
-    return RomUserSchema.model_validate(rom_user)
+    # Encode with pydantic-core directly, so FastAPI doesn't dump, re-validate
+    # and re-encode the already validated schema
+    return Response(
+        content=RomUserSchema.model_validate(rom_user).model_dump_json(),
+        media_type="application/json",
+    )
 
 
 @protected_route(
@@ -972,11 +1003,12 @@ async def update_rom_user(
     "files/{id}",
     [Scope.ROMS_READ],
     responses={status.HTTP_404_NOT_FOUND: {}},
+    response_model=RomFileSchema,
 )
-async def get_romfile(
+def get_romfile(
     request: Request,
     id: Annotated[int, PathVar(description="Rom file internal id.", ge=1)],
-) -> RomFileSchema:
+) -> Response:
     """Retrieve a rom file by ID."""
 
     file = db_rom_handler.get_rom_file_by_id(id)
@@ -986,7 +1018,10 @@ async def get_romfile(
             detail="File not found",
         )
 
-    return RomFileSchema.model_validate(file)
+    return Response(
+        content=RomFileSchema.model_validate(file).model_dump_json(),
+        media_type="application/json",
+    )
 
 
 @protected_route(
@@ -1006,7 +1041,7 @@ async def get_romfile_content(
         request.user.username if request.user.is_authenticated else "unknown"
     )
 
-    file = db_rom_handler.get_rom_file_by_id(id)
+    file = await run_in_threadpool(db_rom_handler.get_rom_file_by_id, id)
     if not file:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1018,15 +1053,7 @@ async def get_romfile_content(
     # Serve the file directly in development mode for emulatorjs
     if DEV_MODE:
         rom_path = fs_rom_handler.validate_path(file.full_path)
-        return FileResponse(
-            path=rom_path,
-            filename=file_name,
-            headers={
-                "Content-Disposition": f"attachment; filename*=UTF-8''{quote(file_name)}; filename=\"{quote(file_name)}\"",
-                "Content-Type": "application/octet-stream",
-                "Content-Length": str(file.file_size_bytes),
-            },
-        )
+        return await _file_response(str(rom_path), file_name)
 
     # Otherwise proxy through nginx
     return FileRedirectResponse(
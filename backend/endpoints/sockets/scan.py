@@ -247,8 +247,7 @@ async def _identify_rom(
         )
         for file in rom_files
     ]
-    for new_rom_file in new_rom_files:
-        db_rom_handler.add_rom_file(new_rom_file)
+    db_rom_handler.add_rom_files(new_rom_files)
 
     if _added_rom.ra_metadata:
         await fs_resource_handler.create_ra_resources_path(platform.id, _added_rom.id)
@@ -349,7 +348,7 @@ async def _identify_platform(
 
     await socket_manager.emit(
         "scan:scanning_platform",
-        PlatformSchema.model_validate(platform).model_dump(
+        PlatformSchema.from_orm_fast(platform).model_dump(
             include={"id", "name", "slug", "fs_slug"}
         ),
     )
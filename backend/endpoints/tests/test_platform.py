@@ -1,6 +1,10 @@
+from datetime import timezone
+
 import pytest
 from fastapi.testclient import TestClient
+from handler.database import db_firmware_handler
 from main import app
+from models.firmware import Firmware
 
 
 @pytest.fixture
@@ -20,3 +24,48 @@ def test_get_platforms(client, access_token, platform):
 
     platforms = response.json()
     assert len(platforms) == 1
+
+
+def test_get_platform_firmware_order(client, access_token, platform):
+    for file_name in ("c_bios.bin", "a_bios.bin", "b_bios.bin"):
+        db_firmware_handler.add_firmware(
+            Firmware(
+                platform_id=platform.id,
+                file_name=file_name,
+                file_name_no_tags=file_name.removesuffix(".bin"),
+                file_name_no_ext=file_name.removesuffix(".bin"),
+                file_extension="bin",
+                file_path=f"{platform.slug}/bios",
+                file_size_bytes=1,
+                crc_hash="",
+                md5_hash="",
+                sha1_hash="",
+            )
+        )
+
+    response = client.get(
+        f"/api/platforms/{platform.id}",
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    assert response.status_code == 200
+
+    firmware = response.json()["firmware"]
+    assert [f["file_name"] for f in firmware] == [
+        "a_bios.bin",
+        "b_bios.bin",
+        "c_bios.bin",
+    ]
+
+
+def test_get_platform_datetime_format(client, access_token, platform):
+    response = client.get(
+        f"/api/platforms/{platform.id}",
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    assert response.status_code == 200
+
+    # Naive database timestamps are sent as UTC with an explicit offset, like in
+    # every other schema
+    created_at = platform.created_at.replace(tzinfo=timezone.utc).isoformat()
+    assert created_at.endswith("+00:00")
+    assert response.json()["created_at"] == created_at
@@ -24,6 +24,23 @@ def test_get_rom(client, access_token, rom):
     assert body["id"] == rom.id
 
 
+def test_get_rom_not_modified(client, access_token, rom):
+    response = client.get(
+        f"/api/roms/{rom.id}",
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    response = client.get(
+        f"/api/roms/{rom.id}",
+        headers={"Authorization": f"Bearer {access_token}", "If-None-Match": etag},
+    )
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+
+
 def test_get_all_roms(client, access_token, rom, platform):
     response = client.get(
         "/api/roms",
@@ -81,6 +98,31 @@ def test_update_rom(rename_fs_rom_mock, get_rom_by_id_mock, client, access_token
     assert get_rom_by_id_mock.called
 
 
+def test_update_rom_user(client, access_token, rom):
+    response = client.put(
+        f"/api/roms/{rom.id}/props",
+        headers={"Authorization": f"Bearer {access_token}"},
+        json={
+            "data": {"rating": 8, "status": "finished", "unknown_field": True},
+            "update_last_played": True,
+        },
+    )
+    assert response.status_code == 200
+
+    body = response.json()
+    assert body["rom_id"] == rom.id
+    assert body["rating"] == 8
+    assert body["status"] == "finished"
+    assert body["last_played"] is not None
+
+    response = client.put(
+        f"/api/roms/{rom.id}/props",
+        headers={"Authorization": f"Bearer {access_token}"},
+        json={"data": {"rating": "not a number"}},
+    )
+    assert response.status_code == 422
+
+
 def test_delete_roms(client, access_token, rom):
     response = client.post(
         "/api/roms/delete",
@@ -1,12 +1,24 @@
 import time
 
-from config import DEV_SQL_ECHO
+from config import (
+    DB_MAX_OVERFLOW,
+    DB_POOL_RECYCLE_SECONDS,
+    DB_POOL_SIZE,
+    DEV_SQL_ECHO,
+)
 from config.config_manager import ConfigManager
 from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
+# Keep enough connections for the threadpool serving sync endpoints, and recycle
+# them before the database server drops idle ones
 sync_engine = create_engine(
-    ConfigManager.get_db_engine(), pool_pre_ping=True, echo=DEV_SQL_ECHO
+    ConfigManager.get_db_engine(),
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_recycle=DB_POOL_RECYCLE_SECONDS,
+    pool_pre_ping=True,
+    echo=DEV_SQL_ECHO,
 )
 sync_session = sessionmaker(bind=sync_engine, expire_on_commit=False)
 
@@ -5,7 +5,7 @@ from decorators.database import begin_session
 from models.platform import Platform
 from models.rom import Rom
 from sqlalchemy import delete, or_, select, update
-from sqlalchemy.orm import Query, Session, selectinload
+from sqlalchemy.orm import Query, Session, selectinload, undefer
 
 from .base_handler import DBBaseHandler
 
@@ -33,6 +33,7 @@ class DBPlatformsHandler(DBBaseHandler):
         platform = session.merge(platform)
         session.flush()
 
+        query = query.options(undefer(Platform.fs_size_bytes))
         return session.scalar(query.filter_by(id=platform.id).limit(1))
 
     @begin_session
@@ -40,6 +41,7 @@ class DBPlatformsHandler(DBBaseHandler):
     def get_platform(
         self, id: int, query: Query = None, session: Session = None
     ) -> Platform | None:
+        query = query.options(undefer(Platform.fs_size_bytes))
         return session.scalar(query.filter_by(id=id).limit(1))
 
     @begin_session
@@ -47,6 +49,7 @@ class DBPlatformsHandler(DBBaseHandler):
     def get_platforms(
         self, query: Query = None, session: Session = None
     ) -> Sequence[Platform]:
+        query = query.options(undefer(Platform.fs_size_bytes))
         return session.scalars(query.order_by(Platform.name.asc())).unique().all()
 
     @begin_session
@@ -62,13 +65,13 @@ class DBPlatformsHandler(DBBaseHandler):
         session.execute(
             delete(Rom)
             .where(Rom.platform_id == id)
-            .execution_options(synchronize_session="evaluate")
+            .execution_options(synchronize_session=False)
         )
 
         session.execute(
             delete(Platform)
             .where(Platform.id == id)
-            .execution_options(synchronize_session="evaluate")
+            .execution_options(synchronize_session=False)
         )
 
     @begin_session
@@ -1,11 +1,12 @@
 import functools
 from collections.abc import Iterable, Sequence
+from itertools import batched
 
 from config import ROMM_DB_DRIVER
 from decorators.database import begin_session
-from models.collection import Collection, VirtualCollection
+from models.collection import Collection, CollectionRom, VirtualCollection
 from models.platform import Platform
-from models.rom import Rom, RomFile, RomMetadata, RomUser
+from models.rom import Rom, RomFile, RomMetadata, RomUser, SiblingRom
 from sqlalchemy import (
     Integer,
     Row,
@@ -15,7 +16,6 @@ from sqlalchemy import (
     case,
     cast,
     delete,
-    false,
     func,
     literal,
     not_,
@@ -28,6 +28,9 @@ from sqlalchemy.orm import InstrumentedAttribute, Query, Session, selectinload
 
 from .base_handler import DBBaseHandler
 
+# Keeps IN lists well under the bind parameter limits of every backend
+FS_NAMES_CHUNK_SIZE = 500
+
 EJS_SUPPORTED_PLATFORMS = [
     "3do",
     "amiga",
@@ -125,7 +128,22 @@ def with_simple(func):
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
         kwargs["query"] = select(Rom).options(
+            selectinload(Rom.platform),
             selectinload(Rom.rom_users),
+            selectinload(Rom.sibling_roms),
+            selectinload(Rom.metadatum),
+            selectinload(Rom.files),
+        )
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+def with_minimal(func):
+    # Only what the scanner reads from a rom, without the per-user relationships
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        kwargs["query"] = select(Rom).options(
             selectinload(Rom.metadatum),
             selectinload(Rom.files),
         )
@@ -136,7 +154,7 @@ def with_simple(func):
 
 class DBRomsHandler(DBBaseHandler):
     @begin_session
-    @with_details
+    @with_minimal
     def add_rom(self, rom: Rom, query: Query = None, session: Session = None) -> Rom:
         rom = session.merge(rom)
         session.flush()
@@ -153,17 +171,16 @@ class DBRomsHandler(DBBaseHandler):
     def filter_by_platform_id(self, query: Query, platform_id: int):
         return query.filter(Rom.platform_id == platform_id)
 
-    def filter_by_collection_id(
-        self, query: Query, session: Session, collection_id: int
-    ):
-        collection = (
-            session.query(Collection)
-            .filter(Collection.id == collection_id)
-            .one_or_none()
+    def filter_by_collection_id(self, query: Query, collection_id: int):
+        # Match against the association table in the database, instead of
+        # loading the collection to send its rom ids back as an IN list
+        return query.filter(
+            Rom.id.in_(
+                select(CollectionRom.rom_id).where(
+                    CollectionRom.collection_id == collection_id
+                )
+            )
         )
-        if collection:
-            return query.filter(Rom.id.in_(collection.rom_ids))
-        return query
 
     def filter_by_virtual_collection_id(
         self, query: Query, session: Session, virtual_collection_id: str
@@ -201,27 +218,23 @@ class DBRomsHandler(DBBaseHandler):
         return query.filter(predicate)
 
     def filter_by_favourite(
-        self, query: Query, session: Session, value: bool, user_id: int | None
+        self, query: Query, value: bool, user_id: int | None
     ) -> Query:
         """Filter based on whether the rom is in the user's Favourites collection."""
-        favourites_collection = (
-            session.query(Collection)
-            .filter(Collection.name.ilike("favourites"))
-            .filter(Collection.user_id == user_id)
-            .one_or_none()
+        # Without a Favourites collection the subquery is empty, so no rom is a
+        # favourite and every rom is a non-favourite
+        favourite_rom_ids = (
+            select(CollectionRom.rom_id)
+            .join(Collection, Collection.id == CollectionRom.collection_id)
+            .where(
+                Collection.name.ilike("favourites"),
+                Collection.user_id == user_id,
+            )
         )
-
-        if favourites_collection:
-            predicate = Rom.id.in_(favourites_collection.rom_ids)
-            if not value:
-                predicate = not_(predicate)
-            return query.filter(predicate)
-
-        # If no Favourites collection exists, return the original query if non-favourites
-        # were requested, or an empty query if favourites were requested.
+        predicate = Rom.id.in_(favourite_rom_ids)
         if not value:
-            return query
-        return query.filter(false())
+            predicate = not_(predicate)
+        return query.filter(predicate)
 
     def filter_by_duplicate(self, query: Query, value: bool) -> Query:
         """Filter based on whether the rom has duplicates."""
@@ -414,7 +427,7 @@ class DBRomsHandler(DBBaseHandler):
             query = self.filter_by_platform_id(query, platform_id)
 
         if collection_id:
-            query = self.filter_by_collection_id(query, session, collection_id)
+            query = self.filter_by_collection_id(query, collection_id)
 
         if virtual_collection_id:
             query = self.filter_by_virtual_collection_id(
@@ -428,9 +441,7 @@ class DBRomsHandler(DBBaseHandler):
             query = self.filter_by_matched(query, value=matched)
 
         if favourite is not None:
-            query = self.filter_by_favourite(
-                query, session=session, value=favourite, user_id=user_id
-            )
+            query = self.filter_by_favourite(query, value=favourite, user_id=user_id)
 
         if duplicate is not None:
             query = self.filter_by_duplicate(query, value=duplicate)
@@ -656,7 +667,13 @@ class DBRomsHandler(DBBaseHandler):
         )
 
     @begin_session
-    @with_details
+    def get_roms_by_ids(
+        self, ids: Sequence[int], session: Session = None
+    ) -> Sequence[Rom]:
+        return session.scalars(select(Rom).where(Rom.id.in_(ids))).all()
+
+    @begin_session
+    @with_minimal
     def get_roms_by_fs_name(
         self,
         platform_id: int,
@@ -665,16 +682,20 @@ class DBRomsHandler(DBBaseHandler):
         session: Session = None,
     ) -> dict[str, Rom]:
         """Retrieve a dictionary of roms by their filesystem names."""
-        roms = (
-            session.scalars(
-                query.filter(Rom.fs_name.in_(fs_names)).filter_by(
-                    platform_id=platform_id
+        roms_by_fs_name: dict[str, Rom] = {}
+        for fs_names_chunk in batched(fs_names, FS_NAMES_CHUNK_SIZE):
+            roms = (
+                session.scalars(
+                    query.filter(Rom.fs_name.in_(fs_names_chunk)).filter_by(
+                        platform_id=platform_id
+                    )
                 )
+                .unique()
+                .all()
             )
-            .unique()
-            .all()
-        )
-        return {rom.fs_name: rom for rom in roms}
+            roms_by_fs_name.update({rom.fs_name: rom for rom in roms})
+
+        return roms_by_fs_name
 
     @begin_session
     def update_rom(self, id: int, data: dict, session: Session = None) -> Rom:
@@ -682,16 +703,22 @@ class DBRomsHandler(DBBaseHandler):
             update(Rom)
             .where(Rom.id == id)
             .values(**data)
-            .execution_options(synchronize_session="evaluate")
+            .execution_options(synchronize_session=False)
         )
-        return session.query(Rom).filter_by(id=id).one()
+        return session.scalars(select(Rom).filter_by(id=id).limit(1)).one()
 
     @begin_session
     def delete_rom(self, id: int, session: Session = None) -> None:
+        session.execute(
+            delete(Rom).where(Rom.id == id).execution_options(synchronize_session=False)
+        )
+
+    @begin_session
+    def delete_roms(self, ids: Sequence[int], session: Session = None) -> None:
         session.execute(
             delete(Rom)
-            .where(Rom.id == id)
-            .execution_options(synchronize_session="evaluate")
+            .where(Rom.id.in_(ids))
+            .execution_options(synchronize_session=False)
         )
 
     @begin_session
@@ -750,62 +777,99 @@ class DBRomsHandler(DBBaseHandler):
             update(RomUser)
             .where(RomUser.id == id)
             .values(**data)
-            .execution_options(synchronize_session="evaluate")
+            .execution_options(synchronize_session=False)
         )
 
-        rom_user = self.get_rom_user_by_id(id)
-        if not rom_user:
-            return None
-
-        if not data.get("is_main_sibling", False):
-            return rom_user
-
-        rom = self.get_rom(rom_user.rom_id)
-        if not rom:
+        # Load the row in this session, which also sees the uncommitted update
+        rom_user = session.get(RomUser, id)
+        if not rom_user or not data.get("is_main_sibling", False):
             return rom_user
 
+        # Demote the siblings in the database, without loading the rom and
+        # its relationships just to read the sibling ids
+        sibling_ids = select(SiblingRom.sibling_rom_id).where(
+            SiblingRom.rom_id == rom_user.rom_id
+        )
         session.execute(
             update(RomUser)
             .where(
                 and_(
-                    RomUser.rom_id.in_(r.id for r in rom.sibling_roms),
+                    RomUser.rom_id.in_(sibling_ids),
                     RomUser.user_id == rom_user.user_id,
                 )
             )
             .values(is_main_sibling=False)
+            .execution_options(synchronize_session=False)
         )
 
-        return session.query(RomUser).filter_by(id=id).one()
+        # Siblings never include the rom itself, so the loaded row is still current
+        return rom_user
 
     @begin_session
     def add_rom_file(self, rom_file: RomFile, session: Session = None) -> RomFile:
         return session.merge(rom_file)
 
+    @begin_session
+    def add_rom_files(
+        self, rom_files: Sequence[RomFile], session: Session = None
+    ) -> Sequence[RomFile]:
+        # New files have no primary key, so there is nothing for merge to look up;
+        # adding them together inserts them all in a single flush
+        session.add_all(rom_files)
+        session.flush()
+
+        return rom_files
+
     @begin_session
     def get_rom_file_by_id(self, id: int, session: Session = None) -> RomFile | None:
         return session.scalar(select(RomFile).filter_by(id=id).limit(1))
 
     @begin_session
     def update_rom_file(self, id: int, data: dict, session: Session = None) -> RomFile:
-        session.execute(
+        update_query = (
             update(RomFile)
             .where(RomFile.id == id)
             .values(**data)
-            .execution_options(synchronize_session="evaluate")
+            .execution_options(synchronize_session=False)
         )
 
+        # PostgreSQL can return the updated row in the same statement
+        if session.get_bind().dialect.update_returning:
+            return session.scalars(update_query.returning(RomFile)).one()
+
+        session.execute(update_query)
         return session.query(RomFile).filter_by(id=id).one()
 
+    @begin_session
+    def rename_rom_files(
+        self, rom_id: int, old_name: str, new_name: str, session: Session = None
+    ) -> None:
+        session.execute(
+            update(RomFile)
+            .where(RomFile.rom_id == rom_id)
+            .values(
+                file_name=func.replace(RomFile.file_name, old_name, new_name),
+                file_path=func.replace(RomFile.file_path, old_name, new_name),
+            )
+            .execution_options(synchronize_session=False)
+        )
+
     @begin_session
     def purge_rom_files(
         self, rom_id: int, session: Session = None
     ) -> Sequence[RomFile]:
-        purged_rom_files = (
-            session.scalars(select(RomFile).filter_by(rom_id=rom_id)).unique().all()
-        )
-        session.execute(
+        delete_query = (
             delete(RomFile)
             .where(RomFile.rom_id == rom_id)
             .execution_options(synchronize_session="evaluate")
         )
+
+        # PostgreSQL and MariaDB can return the deleted rows in the same statement
+        if session.get_bind().dialect.delete_returning:
+            return session.scalars(delete_query.returning(RomFile)).all()
+
+        purged_rom_files = (
+            session.scalars(select(RomFile).filter_by(rom_id=rom_id)).unique().all()
+        )
+        session.execute(delete_query)
         return purged_rom_files
@@ -43,16 +43,3 @@ class DBStatsHandler(DBBaseHandler):
             )
             or 0
         )
-
-    @begin_session
-    def get_platform_filesize(self, platform_id: int, session: Session = None) -> int:
-        """Get the total filesize of all roms in the database, in bytes."""
-        return (
-            session.scalar(
-                select(func.sum(RomFile.file_size_bytes))
-                .select_from(RomFile)
-                .join(Rom)
-                .filter(Rom.platform_id == platform_id)
-            )
-            or 0
-        )
@@ -45,7 +45,7 @@ PS2_OPL_REGEX: Final = re.compile(r"^([A-Z]{4}_\d{3}\.\d{2})\..*$")
 PS2_OPL_KEY: Final = "romm:ps2_opl_index"
 
 # Sony serial codes for PS1, PS2, and PSP
-SONY_SERIAL_REGEX: Final = re.compile(r".*([a-zA-Z]{4}-\d{5}).*$")
+SONY_SERIAL_REGEX: Final = re.compile(r".*([A-Z]{4}-\d{5}).*$", re.IGNORECASE)
 
 PS1_SERIAL_INDEX_KEY: Final = "romm:ps1_serial_index"
 PS2_SERIAL_INDEX_KEY: Final = "romm:ps2_serial_index"
@@ -100,7 +100,8 @@ class MetadataHandler:
         conditionally_set_cache(PS2_SERIAL_INDEX_KEY, "ps2_serial_index.json")
         conditionally_set_cache(PSP_SERIAL_INDEX_KEY, "psp_serial_index.json")
 
-    def normalize_cover_url(self, url: str) -> str:
+    @staticmethod
+    def normalize_cover_url(url: str) -> str:
         return url if not url else f"https:{url.replace('https:', '')}"
 
     def normalize_search_term(
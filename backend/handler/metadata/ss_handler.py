@@ -1,5 +1,4 @@
 import base64
-import re
 from datetime import datetime
 from typing import Final, NotRequired, TypedDict
 from urllib.parse import quote
@@ -332,7 +331,7 @@ class SSHandler(MetadataHandler):
             fallback_rom = SSRom(ss_id=None, name=search_term)
 
         # Support for sony serial filename format (PS, PS3, PS3)
-        match = SONY_SERIAL_REGEX.search(file_name, re.IGNORECASE)
+        match = SONY_SERIAL_REGEX.search(file_name)
         if platform_ss_id == PS1_SS_ID and match:
             search_term = await self._ps1_serial_format(match, search_term)
             fallback_rom = SSRom(ss_id=None, name=search_term)
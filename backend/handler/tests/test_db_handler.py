@@ -7,9 +7,10 @@ from handler.database import (
     db_state_handler,
     db_user_handler,
 )
+from handler.database.roms_handler import FS_NAMES_CHUNK_SIZE
 from models.assets import Save, Screenshot, State
 from models.platform import Platform
-from models.rom import Rom
+from models.rom import Rom, RomFile
 from models.user import Role, User
 from sqlalchemy.exc import IntegrityError
 
@@ -69,6 +70,71 @@ def test_roms(rom: Rom, platform: Platform):
     assert len(roms) == 1
 
 
+def test_get_roms_by_fs_name(rom: Rom, platform: Platform):
+    # Enough names to span more than one IN chunk
+    fs_names = [f"missing_rom_{i}.zip" for i in range(FS_NAMES_CHUNK_SIZE)]
+    fs_names.append(rom.fs_name)
+
+    roms_by_fs_name = db_rom_handler.get_roms_by_fs_name(
+        platform_id=platform.id, fs_names=fs_names
+    )
+    assert list(roms_by_fs_name) == [rom.fs_name]
+    assert roms_by_fs_name[rom.fs_name].id == rom.id
+
+
+def test_rename_rom_files(rom: Rom):
+    rom_files = [
+        db_rom_handler.add_rom_file(
+            RomFile(
+                rom_id=rom.id,
+                file_name=f"test_rom (Disc {disc}).bin",
+                file_path=f"{rom.fs_path}/test_rom",
+            )
+        )
+        for disc in (1, 2)
+    ]
+
+    db_rom_handler.rename_rom_files(rom.id, "test_rom", "renamed_rom")
+
+    for disc, rom_file in enumerate(rom_files, start=1):
+        renamed_file = db_rom_handler.get_rom_file_by_id(rom_file.id)
+        assert renamed_file is not None
+        assert renamed_file.file_name == f"renamed_rom (Disc {disc}).bin"
+        assert renamed_file.file_path == f"{rom.fs_path}/renamed_rom"
+
+
+def test_add_rom_files(rom: Rom):
+    rom_files = db_rom_handler.add_rom_files(
+        [
+            RomFile(
+                rom_id=rom.id,
+                file_name=f"test_rom (Disc {disc}).bin",
+                file_path=f"{rom.fs_path}/test_rom",
+            )
+            for disc in (1, 2)
+        ]
+    )
+
+    for rom_file in rom_files:
+        added_file = db_rom_handler.get_rom_file_by_id(rom_file.id)
+        assert added_file is not None
+        assert added_file.rom_id == rom.id
+
+
+def test_purge_rom_files(rom: Rom):
+    rom_file = db_rom_handler.add_rom_file(
+        RomFile(
+            rom_id=rom.id,
+            file_name="test_rom.zip",
+            file_path=f"{rom.fs_path}/test_rom",
+        )
+    )
+
+    purged_rom_files = db_rom_handler.purge_rom_files(rom.id)
+    assert [f.id for f in purged_rom_files] == [rom_file.id]
+    assert db_rom_handler.get_rom_file_by_id(rom_file.id) is None
+
+
 def test_users(admin_user):
     db_user_handler.add_user(
         User(
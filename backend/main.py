@@ -7,6 +7,7 @@ import alembic.config
 import endpoints.sockets.scan  # noqa
 import sentry_sdk
 import uvicorn
+from anyio import to_thread
 from config import (
     DEV_HOST,
     DEV_PORT,
@@ -14,6 +15,7 @@ from config import (
     IS_PYTEST_RUN,
     ROMM_AUTH_SECRET_KEY,
     SENTRY_DSN,
+    THREADPOOL_MAX_WORKERS,
 )
 from endpoints import (
     auth,
@@ -55,6 +57,7 @@ logging.config.dictConfig(LOGGING_CONFIG)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
+    to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_MAX_WORKERS
     async with initialize_context():
         app.state.aiohttp_session = ctx_aiohttp_session.get()
         app.state.httpx_client = ctx_httpx_client.get()
@@ -1,11 +1,10 @@
 from __future__ import annotations
 
-from functools import cached_property
 from typing import TYPE_CHECKING
 
 from models.base import FILE_PATH_MAX_LENGTH, BaseModel
-from models.rom import Rom
-from sqlalchemy import String, func, select
+from models.rom import Rom, RomFile
+from sqlalchemy import BigInteger, String, cast, func, select
 from sqlalchemy.orm import Mapped, column_property, mapped_column, relationship
 
 if TYPE_CHECKING:
@@ -43,7 +42,7 @@ class Platform(BaseModel):
 
     roms: Mapped[list[Rom]] = relationship(lazy="select", back_populates="platform")
     firmware: Mapped[list[Firmware]] = relationship(
-        lazy="select", back_populates="platform"
+        lazy="select", back_populates="platform", order_by="Firmware.file_name"
     )
 
     aspect_ratio: Mapped[str] = mapped_column(
@@ -55,6 +54,18 @@ class Platform(BaseModel):
         select(func.count(Rom.id)).where(Rom.platform_id == id).scalar_subquery()
     )
 
+    # This runs a subquery to get the total size of the platform's rom files,
+    # so listing platforms doesn't issue an extra query per platform. It's
+    # deferred, as roms load their platform eagerly, and only the platform
+    # queries that return it to the client undefer it
+    fs_size_bytes = column_property(
+        select(cast(func.coalesce(func.sum(RomFile.file_size_bytes), 0), BigInteger))
+        .join(Rom, Rom.id == RomFile.rom_id)
+        .where(Rom.platform_id == id)
+        .scalar_subquery(),
+        deferred=True,
+    )
+
     missing_from_fs: Mapped[bool] = mapped_column(default=False, nullable=False)
 
     @property
@@ -72,11 +83,5 @@ class Platform(BaseModel):
     def is_identified(self) -> bool:
         return not self.is_unidentified
 
-    @cached_property
-    def fs_size_bytes(self) -> int:
-        from handler.database import db_stats_handler
-
-        return db_stats_handler.get_platform_filesize(self.id)
-
     def __repr__(self) -> str:
         return self.name
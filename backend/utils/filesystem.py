@@ -1,5 +1,4 @@
 import os
-import re
 from collections.abc import Iterator
 from pathlib import Path
 
@@ -30,8 +29,14 @@ def iter_directories(path: str, recursive: bool = False) -> Iterator[tuple[Path,
             break
 
 
-INVALID_CHARS_HYPHENS = re.compile(r"[\\/:|]")
-INVALID_CHARS_EMPTY = re.compile(r'[*?"<>]')
+# Characters that are invalid on common filesystems, mapped to their replacement.
+# Null bytes are removed too (ZFS allows any characters except null bytes)
+INVALID_CHARS_TABLE = str.maketrans(
+    {
+        **dict.fromkeys("\\/:|", "-"),
+        **dict.fromkeys('*?"<>\0', None),
+    }
+)
 
 
 def sanitize_filename(filename: str) -> str:
@@ -44,17 +49,8 @@ def sanitize_filename(filename: str) -> str:
     Returns:
     - str: The sanitized filename.
     """
-    # Replace some invalid characters with hyphen
-    sanitized_filename = INVALID_CHARS_HYPHENS.sub("-", filename)
-
-    # Remove other invalid characters
-    sanitized_filename = INVALID_CHARS_EMPTY.sub("", sanitized_filename)
-
-    # Ensure null bytes are not included (ZFS allows any characters except null bytes)
-    sanitized_filename = sanitized_filename.replace("\0", "")
-
-    # Remove leading/trailing whitespace
-    sanitized_filename = sanitized_filename.strip()
+    # Replace or remove invalid characters in a single pass, and strip whitespace
+    sanitized_filename = filename.translate(INVALID_CHARS_TABLE).strip()
 
     # Ensure the filename is not empty
     if not sanitized_filename:
@@ -0,0 +1,15 @@
+from uvicorn_worker import UvicornWorker as BaseUvicornWorker
+
+
+class UvicornWorker(BaseUvicornWorker):
+    """Uvicorn worker for gunicorn that requires the uvloop event loop and httptools parser.
+
+    The base worker uses `auto` for both, which silently falls back to asyncio and h11
+    when the compiled dependencies are missing, instead of failing on startup.
+    """
+
+    CONFIG_KWARGS = {
+        **BaseUvicornWorker.CONFIG_KWARGS,
+        "loop": "uvloop",
+        "http": "httptools",
+    }
@@ -51,6 +51,7 @@ export type { RomMetadataSchema } from './models/RomMetadataSchema';
 export type { RomMobyMetadata } from './models/RomMobyMetadata';
 export type { RomRAMetadata } from './models/RomRAMetadata';
 export type { RomSSMetadata } from './models/RomSSMetadata';
+export type { RomUserForm } from './models/RomUserForm';
 export type { RomUserSchema } from './models/RomUserSchema';
 export type { RomUserStatus } from './models/RomUserStatus';
 export type { SaveSchema } from './models/SaveSchema';
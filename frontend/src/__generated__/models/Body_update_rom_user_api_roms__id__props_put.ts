@@ -2,7 +2,12 @@
 /* istanbul ignore file */
 /* tslint:disable */
 /* eslint-disable */
+import type { RomUserForm } from './RomUserForm';
 export type Body_update_rom_user_api_roms__id__props_put = {
+    /**
+     * Rom user data to update.
+     */
+    data?: RomUserForm;
     /**
      * Whether to update the last played date.
      */
@@ -10,6 +10,7 @@ export type PlatformSchema = {
     rom_count: number;
     name: string;
     custom_name?: (string | null);
+    display_name: string;
     igdb_id?: (number | null);
     sgdb_id?: (number | null);
     moby_id?: (number | null);
@@ -33,7 +34,6 @@ export type PlatformSchema = {
     is_unidentified: boolean;
     is_identified: boolean;
     missing_from_fs: boolean;
-    readonly display_name: string;
     readonly moby_slug: (string | null);
 };
 
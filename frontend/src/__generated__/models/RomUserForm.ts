@@ -0,0 +1,18 @@
+/* generated using openapi-typescript-codegen -- do not edit */
+/* istanbul ignore file */
+/* tslint:disable */
+/* eslint-disable */
+import type { RomUserStatus } from './RomUserStatus';
+export type RomUserForm = {
+    note_raw_markdown?: (string | null);
+    note_is_public?: (boolean | null);
+    is_main_sibling?: (boolean | null);
+    backlogged?: (boolean | null);
+    now_playing?: (boolean | null);
+    hidden?: (boolean | null);
+    rating?: (number | null);
+    difficulty?: (number | null);
+    completion?: (number | null);
+    status?: (RomUserStatus | null);
+};
+